@@ -1,13 +1,14 @@
-from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
-try:
-    __version__ = version("task-messager")
-except Exception:
-    __version__ = "0.2.X"
-
-from .core import DOMAINS, app
+from ._version import __version__
+from .domains import DOMAINS, AnalysisStep, Domain
 from .logger import setup_logging
-from .models import AnalysisStep, Domain, SendMessageInput, SendMessageResult, SolutionStep
+from .models import SendMessageInput, SendMessageResult, SolutionStep
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+    app: FastMCP
 
 __all__ = [
     "DOMAINS",
@@ -16,6 +17,16 @@ __all__ = [
     "SendMessageInput",
     "SendMessageResult",
     "SolutionStep",
+    "__version__",
     "app",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve `app` lazily so importing the package does not load FastMCP."""
+    if name == "app":
+        from .server import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,238 @@
+# ruff: noqa: E501
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+@dataclass(slots=True, frozen=True)
+class AnalysisStep:
+    """Define a single step in the investigation checklist, with a title and detailed explanation."""
+
+    title: str
+    detail: str
+
+
+@dataclass(slots=True, frozen=True)
+class Domain:
+    """Define investigation template for a specific domain, including checklist steps and acceptance criteria."""
+
+    label: str
+    analysis_steps: tuple[AnalysisStep, ...]
+    acceptance_criteria: tuple[str, ...]
+
+
+# Read-only so the per-domain caches in `models` can safely share these values.
+DOMAINS: Mapping[str, Domain] = MappingProxyType({
+    "backend": Domain(
+        label="Backend",
+        analysis_steps=(
+            AnalysisStep(
+                title="API / Endpoint İnceleme",
+                detail="İlgili endpoint'in request/response logları ve HTTP durum kodları incelenir.",
+            ),
+            AnalysisStep(
+                title="Veritabanı Sorgusu",
+                detail="Yavaş veya hatalı sorgular EXPLAIN/ANALYZE ile analiz edilir; index kullanımı kontrol edilir.",
+            ),
+            AnalysisStep(
+                title="Kuyruk & Async İşlem",
+                detail="Message queue (SQS, RabbitMQ vb.) backlog, dead-letter kayıtları ve consumer hataları gözden geçirilir.",
+            ),
+            AnalysisStep(
+                title="Servis Bağımlılıkları",
+                detail="Downstream servislerin sağlık durumu (health-check) ve timeout değerleri doğrulanır.",
+            ),
+            AnalysisStep(
+                title="Bulgu Paylaşımı",
+                detail="Kök neden ve önerilen düzeltme teknik dille raporlanır.",
+            ),
+        ),
+        acceptance_criteria=(
+            "Hatalı endpoint veya servis tespit edilmiş ve logları alınmıştır.",
+            "Veritabanı tarafında anomali olup olmadığı netleştirilmiştir.",
+            "Sorunun kaynağı (kod hatası, config, altyapı) belirlenmiştir.",
+            "Düzeltme önerisi veya geçici workaround talep sahibine iletilmiştir.",
+        ),
+    ),
+    "frontend": Domain(
+        label="Frontend",
+        analysis_steps=(
+            AnalysisStep(
+                title="Tarayıcı & Ortam Tespiti",
+                detail="Sorunun hangi tarayıcı/versiyon ve işletim sisteminde oluştuğu belirlenir.",
+            ),
+            AnalysisStep(
+                title="Console & Network İnceleme",
+                detail="DevTools console hataları ve başarısız network istekleri (4xx/5xx) analiz edilir.",
+            ),
+            AnalysisStep(
+                title="State & Render Kontrolü",
+                detail="Bileşen state'i, props akışı ve gereksiz re-render'lar React/Vue DevTools ile incelenir.",
+            ),
+            AnalysisStep(
+                title="Performans Profili",
+                detail="Lighthouse veya DevTools Performance sekmesiyle LCP, CLS, FID metrikleri ölçülür.",
+            ),
+            AnalysisStep(
+                title="Bulgu Paylaşımı",
+                detail="Reproducing adımları ve ekran görüntüleriyle birlikte rapor hazırlanır.",
+            ),
+        ),
+        acceptance_criteria=(
+            "Sorun belirli tarayıcı/cihaz kombinasyonunda tekrarlanabilir hale getirilmiştir.",
+            "Console hatası veya network isteği kök nedeni tespit edilmiştir.",
+            "Düzeltme PR'ı açılmış ya da geçici CSS/JS fix uygulanmıştır.",
+            "Analiz raporu ve ekran görüntüleri talep sahibine iletilmiştir.",
+        ),
+    ),
+    "devops": Domain(
+        label="DevOps / Altyapı",
+        analysis_steps=(
+            AnalysisStep(
+                title="Pipeline & Build İnceleme",
+                detail="CI/CD pipeline logları (GitHub Actions, GitLab CI vb.) adım adım incelenir; hatalı stage belirlenir.",
+            ),
+            AnalysisStep(
+                title="Container & Orchestration",
+                detail="Docker container logları, exit code'lar ve restart politikası kontrol edilir.",
+            ),
+            AnalysisStep(
+                title="Altyapı Kaynakları",
+                detail="CPU, bellek, disk ve ağ metrikleri (CloudWatch, Grafana vb.) anomali açısından incelenir.",
+            ),
+            AnalysisStep(
+                title="Güvenlik & Erişim",
+                detail="IAM izinleri, Security Group kuralları ve secret/env değişkenleri doğrulanır.",
+            ),
+            AnalysisStep(
+                title="Bulgu Paylaşımı",
+                detail="RCA (Root Cause Analysis) ve iyileştirme önerisi runbook formatında paylaşılır.",
+            ),
+        ),
+        acceptance_criteria=(
+            "Pipeline veya deployment hatası tam log çıktısıyla belgelenmiştir.",
+            "Altyapı kaynak tüketimi anomalisi tespit edilmiş veya dışlanmıştır.",
+            "Güvenlik açığı veya yanlış config varsa düzeltilmiş ya da bilet açılmıştır.",
+            "Servis başarıyla yeniden deploy edilmiş ve sağlık kontrolü geçmiştir.",
+        ),
+    ),
+    "mobile": Domain(
+        label="Mobil",
+        analysis_steps=(
+            AnalysisStep(
+                title="Crash & Hata Raporu",
+                detail="Firebase Crashlytics / Sentry üzerinden stack trace ve etkilenen cihaz/OS versiyonları incelenir.",
+            ),
+            AnalysisStep(
+                title="Build & Sürüm Kontrolü",
+                detail="Uygulama versiyonu, build numarası ve bağımlılık versiyonları doğrulanır.",
+            ),
+            AnalysisStep(
+                title="API & Bağlantı Testi",
+                detail="Mobil taraftan gelen API isteklerinin başarı oranı ve timeout değerleri kontrol edilir.",
+            ),
+            AnalysisStep(
+                title="Store Kural Uyumu",
+                detail="App Store / Google Play politika değişiklikleri ve inceleme geri bildirimleri gözden geçirilir.",
+            ),
+            AnalysisStep(
+                title="Bulgu Paylaşımı",
+                detail="Etkilenen cihaz/OS matrisi ve düzeltme planı talep sahibine iletilir.",
+            ),
+        ),
+        acceptance_criteria=(
+            "Crash stack trace'i alınmış ve kök neden belirlenmiştir.",
+            "Sorunun belirli OS versiyonu veya cihazla sınırlı olup olmadığı netleştirilmiştir.",
+            "Düzeltme içeren yeni build hazırlanmış veya hotfix planı oluşturulmuştur.",
+            "Analiz sonucu talep sahibine ve varsa store ekibine iletilmiştir.",
+        ),
+    ),
+    "data": Domain(
+        label="Veri / Analytics",
+        analysis_steps=(
+            AnalysisStep(
+                title="Pipeline Sağlığı",
+                detail="ETL/ELT pipeline'ının durum logları (Airflow, dbt vb.) incelenir; başarısız tasklar ve gecikmeler tespit edilir.",
+            ),
+            AnalysisStep(
+                title="Veri Kalitesi Kontrolü",
+                detail="Kaynak ve hedef veri setleri arasında null oranları, veri tipleri ve aykırı değerler (outlier) analiz edilir.",
+            ),
+            AnalysisStep(
+                title="Storage & Bağlantı",
+                detail="Veritabanı/Data Warehouse bağlantıları, sorgu performansı ve depolama kapasitesi kontrol edilir.",
+            ),
+            AnalysisStep(
+                title="Raporlama & Metrikleri",
+                detail="BI araçları (Tableau, Power BI vb.) raporlarının güncel olup olmadığı ve hesaplamaları doğrulanır.",
+            ),
+            AnalysisStep(
+                title="Bulgu Paylaşımı",
+                detail="Veri anomalisi ve düzeltme planı veri ekibine ve ilgili paydaşlara iletilir.",
+            ),
+        ),
+        acceptance_criteria=(
+            "Pipeline hatası tam ayrıntılı loglarla belgelenmiştir.",
+            "Veri kalitesi sorusu (eksik, yanlış, geç veri) tespit edilmiş veya dışlanmıştır.",
+            "Etkilenen raporlar ve metrikler belirlenmiştir.",
+            "Düzeltme veya geçici workaround uygulanmış sosyal medya kullanıcılarına bildirilmiştir.",
+        ),
+    ),
+    "business": Domain(
+        label="İşletme / Proses",
+        analysis_steps=(
+            AnalysisStep(
+                title="Gereksinim Analizi",
+                detail="İstenilen görev, hedef ve başarı ölçütleri paydaşlarla netleştirilir.",
+            ),
+            AnalysisStep(
+                title="Mevcut Durum Değerlendirmesi",
+                detail="Mevcut belgeler, süreçler ve altyapı incelenir; boşluklar ve iyileştirme fırsatları tespit edilir.",
+            ),
+            AnalysisStep(
+                title="Çözüm Tasarımı",
+                detail="Önerilen yeni belgeler, iş akışları veya araçlar tasarlanır; maliyet-fayda analizi yapılır.",
+            ),
+            AnalysisStep(
+                title="Uygulama Planı",
+                detail="Adım adım uygulama takvimi, sorumlu taraflar ve kontrol noktaları tanımlanır.",
+            ),
+            AnalysisStep(
+                title="Bulgu Paylaşımı",
+                detail="Özetlenmiş rapor ve uygulanabilir öneriler yöneticilere ve ilgili ekiplere sunulur.",
+            ),
+        ),
+        acceptance_criteria=(
+            "Görev gereksinimleri ve başarı kriterleri yazılı olarak onaylanmıştır.",
+            "Mevcut durum analizi tamamlanmış ve iyileştirme alanları belirlenmiştir.",
+            "Çözüm önerisi ve uygulama planı hazırlanmıştır.",
+            "Plan paydaşlarca gözden geçirilmiş ve kabul edilmiştir.",
+        ),
+    ),
+    "general": Domain(
+        label="Genel",
+        analysis_steps=(
+            AnalysisStep(
+                title="Sorgulama",
+                detail="İletilen bilgiler kullanılarak mevcut durum ve bağlam netleştirilir.",
+            ),
+            AnalysisStep(
+                title="Log Analizi",
+                detail="İlgili sistem loglarından hata ve anomaliler incelenir.",
+            ),
+            AnalysisStep(
+                title="Bağımlılık Kontrolü",
+                detail="Üçüncü taraf servisler ve entegrasyonlar sağlık durumu açısından değerlendirilir.",
+            ),
+            AnalysisStep(
+                title="Bulgu Paylaşımı",
+                detail="Tespit edilen anomali veya çözüm önerisi teknik dille raporlanır.",
+            ),
+        ),
+        acceptance_criteria=(
+            "Sorunun kapsamı ve etki alanı belirlenmiştir.",
+            "Kök neden (kullanıcı hatası mı, yazılım bug'ı mı, altyapı mı) netleştirilmiştir.",
+            "Analiz sonucu ve çözüm önerisi talep sahibine iletilmiştir.",
+        ),
+    ),
+})
@@ -1,8 +1,20 @@
+import functools
 import html
-import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from task_messager.models import SendMessageInput, SolutionStep, SolutionStepSection, TaskDescription
+import orjson
+
+from task_messager.domains import DOMAINS
+from task_messager.models import (
+    SendMessageInput,
+    SolutionStep,
+    SolutionStepSection,
+    TaskDescription,
+    _domain_default_steps,
+)
+
+if TYPE_CHECKING:
+    import re
 
 type Payload = dict[str, Any]
 
@@ -30,6 +42,23 @@ _VALID_SUFFIXES = (
     "Test Edilecek",
     "Analiz Edilecek",
 )
+_VALID_SUFFIXES_LOWER: tuple[str, ...] = tuple(s.lower() for s in _VALID_SUFFIXES)
+
+# group name -> (verb root suffix, future-tense replacement)
+_NOMINALIZATIONS: dict[str, tuple[str, str]] = {
+    "gelistirme": ("Geliştirme", "Geliştirilecek"),
+    "duzenleme": ("Düzenleme", "Düzenlenecek"),
+    "inceleme": ("İnceleme", "İncelenecek"),
+    "arastirma": ("Araştırma", "Araştırılacak"),
+    "olusturma": ("Oluşturma", "Oluşturulacak"),
+    "kaldirma": ("Kaldırma", "Kaldırılacak"),
+    "guncelleme": ("Güncelleme", "Güncellenecek"),
+    "test_etme": ("Test Etme", "Test Edilecek"),
+    "entegrasyon": ("Entegrasyon", "Entegre Edilecek"),
+    "analiz": ("Analiz", "Analiz Edilecek"),
+    "duzeltme": ("Düzeltme", "Düzeltilecek"),
+}
+_NOM_MAP = {name: replacement for name, (_, replacement) in _NOMINALIZATIONS.items()}
 
 
 def format_title(raw_title: str, project: str, domain: str) -> str:
@@ -42,8 +71,7 @@ def format_title(raw_title: str, project: str, domain: str) -> str:
 
     # Case-insensitive check for already-correct future-tense suffixes
     action_lower = action.lower()
-    valid_suffixes_lower = tuple(s.lower() for s in _VALID_SUFFIXES)
-    if not any(action_lower.endswith(suffix) for suffix in valid_suffixes_lower):
+    if not action_lower.endswith(_VALID_SUFFIXES_LOWER):
         action = _nominalize_to_future(action)
 
     domain_prefix = DOMAIN_PREFIX.get(domain, "")
@@ -55,25 +83,23 @@ def format_title(raw_title: str, project: str, domain: str) -> str:
     return action
 
 
+@functools.lru_cache(maxsize=1)
+def _nominalization_re() -> "re.Pattern[str]":
+    """Compile the verb-root alternation on first use; titles with a valid suffix never need it."""
+    import re
+
+    return re.compile(
+        "|".join(f"(?P<{name}>{re.escape(root)})$" for name, (root, _) in _NOMINALIZATIONS.items()),
+        re.IGNORECASE,
+    )
+
+
 def _nominalize_to_future(action: str) -> str:
     """Nominalize action verbs to future tense if they end with a common verb root"""
 
-    replacements = [
-        (r"Geliştirme$", "Geliştirilecek"),
-        (r"Düzenleme$", "Düzenlenecek"),
-        (r"İnceleme$", "İncelenecek"),
-        (r"Araştırma$", "Araştırılacak"),
-        (r"Oluşturma$", "Oluşturulacak"),
-        (r"Kaldırma$", "Kaldırılacak"),
-        (r"Güncelleme$", "Güncellenecek"),
-        (r"Test Etme$", "Test Edilecek"),
-        (r"Entegrasyon$", "Entegre Edilecek"),
-        (r"Analiz$", "Analiz Edilecek"),
-        (r"Düzeltme$", "Düzeltilecek"),
-    ]
-    for pattern, replacement in replacements:
-        if re.search(pattern, action, re.IGNORECASE):
-            return re.sub(pattern, replacement, action, flags=re.IGNORECASE)
+    match = _nominalization_re().search(action)
+    if match and match.lastgroup:
+        return action[: match.start()] + _NOM_MAP[match.lastgroup]
 
     return f"{action} Yapılacak"
 
@@ -91,29 +117,51 @@ def to_markdown(title: str, desc: TaskDescription) -> str:
         **Çözümün Avantajları:**
         - Avantaj 1
     """
-    lines: list[str] = [f"# {title}", ""]
-
-    lines.append(f"**Özet:** {desc.summary}")
-    lines.append("")
-    lines.append(f"**Problem:** {desc.problem}")
-    lines.append("")
+    step_lines = [
+        line
+        for i, step in enumerate(desc.solution_steps, start=1)
+        for line in (f"{i}. **{step.title}:**", *(f"   - {item}" for item in step.items))
+    ]
 
-    lines.append("**Muhtemel Çözüm:**")
-    for i, step in enumerate(desc.solution_steps, start=1):
-        lines.append(f"{i}. **{step.title}:**")
-        for item in step.items:
-            lines.append(f"   - {item}")
-    lines.append("")
+    return "\n".join([
+        f"# {title}",
+        "",
+        f"**Özet:** {desc.summary}",
+        "",
+        f"**Problem:** {desc.problem}",
+        "",
+        "**Muhtemel Çözüm:**",
+        *step_lines,
+        "",
+        "**Çözümün Avantajları:**",
+        *(f"- {adv}" for adv in desc.advantages),
+    ])
 
-    lines.append("**Çözümün Avantajları:**")
-    for adv in desc.advantages:
-        lines.append(f"- {adv}")
 
-    return "\n".join(lines)
+_HTML_UNSAFE = frozenset("&<>\"'")
 
 
 def _h(text: str) -> str:
-    return html.escape(text)
+    """`html.escape`, skipped for the common case of text with nothing to escape."""
+    return text if _HTML_UNSAFE.isdisjoint(text) else html.escape(text)
+
+
+# Domain labels are static; escape them once instead of on every card.
+_DOMAIN_LABELS_ESCAPED: dict[str, str] = {key: _h(info.label) for key, info in DOMAINS.items()}
+
+# Static card section headers; only the widgets are filled in per request.
+_SECTION_TASK: Payload = {"header": "Görev Açıklaması"}
+_SECTION_SOLUTION: Payload = {"header": "Muhtemel Çözüm"}
+_SECTION_ADVANTAGES: Payload = {"header": "Çözümün Avantajları"}
+_SECTION_CRITERIA: Payload = {"header": "Kabul Kriterleri"}
+
+
+def _key_value(top_label: str, content: str) -> Payload:
+    return {"keyValue": {"topLabel": top_label, "content": content}}
+
+
+def _text_section(section: Payload, text: str) -> Payload:
+    return {**section, "widgets": [{"textParagraph": {"text": text}}]}
 
 
 def format_summary_block(summary: str, problem: str) -> str:
@@ -121,27 +169,35 @@ def format_summary_block(summary: str, problem: str) -> str:
 
 
 def format_solution_steps_html(steps: list[SolutionStep]) -> str:
-    lines: list[str] = []
-    for step in steps:
-        lines.append(f"• <b>{_h(step.title)}:</b> {_h(step.detail)}")
-    return "<br>".join(lines)
+    return "<br>".join([f"• <b>{_h(step.title)}:</b> {_h(step.detail)}" for step in steps])
 
 
 def format_rich_solution_steps_html(sections: list[SolutionStepSection]) -> str:
-    lines: list[str] = []
-    for i, section in enumerate(sections, start=1):
-        lines.append(f"<b>{i}. {_h(section.title)}</b>")
-        for item in section.items:
-            lines.append(f"&nbsp;&nbsp;• {_h(item)}")
-    return "<br>".join(lines)
+    return "<br>".join([
+        line
+        for i, section in enumerate(sections, start=1)
+        for line in (f"<b>{i}. {_h(section.title)}</b>", *[f"&nbsp;&nbsp;• {_h(item)}" for item in section.items])
+    ])
 
 
 def format_advantages_html(advantages: list[str]) -> str:
-    return "<br>".join(f"✓ {_h(adv)}" for adv in advantages)
+    return "<br>".join([f"✓ {_h(adv)}" for adv in advantages])
 
 
 def format_acceptance_criteria_html(criteria: list[str]) -> str:
-    return "<br>".join(f"• {_h(item)}" for item in criteria)
+    return "<br>".join([f"• {_h(item)}" for item in criteria])
+
+
+@functools.cache
+def _default_steps_html(domain: str) -> str:
+    """Render a domain's default analysis steps once; every request that omits steps shares it."""
+    return format_solution_steps_html(list(_domain_default_steps(domain)))
+
+
+@functools.cache
+def _default_criteria_html(domain: str) -> str:
+    """Render a domain's default acceptance criteria once; every request that omits them shares it."""
+    return format_acceptance_criteria_html(list(DOMAINS[domain].acceptance_criteria))
 
 
 def build_cards_payload(data: SendMessageInput, desc: TaskDescription | None = None) -> Payload:
@@ -160,56 +216,46 @@ def build_cards_payload(data: SendMessageInput, desc: TaskDescription | None = N
         [Avantajlar]   Çözümün Avantajları  ← yalnızca desc verilirse
         [Kriterler]    Kabul Kriterleri
     """
-    domain_info = data.resolved_domain()
-    domain_label = domain_info.get("label", "Genel")
-
-    sections: list[Payload] = []
+    domain_label = _DOMAIN_LABELS_ESCAPED.get(data.domain, _DOMAIN_LABELS_ESCAPED["general"])
 
     meta_widgets: list[Payload] = [
-        {"keyValue": {"topLabel": "Alan", "content": _h(domain_label)}},
-        {"keyValue": {"topLabel": "Tahmini Süre", "content": _h(data.estimated_duration)}},
+        _key_value("Alan", domain_label),
+        _key_value("Tahmini Süre", _h(data.estimated_duration)),
+        *([_key_value("Atanan", _h(data.task_owner))] if data.task_owner else []),
+        *([_key_value("Katılımcılar", ", ".join(map(_h, data.participants)))] if data.participants else []),
     ]
 
-    if data.task_owner:
-        meta_widgets.append({"keyValue": {"topLabel": "Atanan", "content": _h(str(data.task_owner))}})
-
-    if data.participants:
-        meta_widgets.append({
-            "keyValue": {
-                "topLabel": "Katılımcılar",
-                "content": _h(", ".join(data.participants)),
-            }
-        })
-
-    sections.append({"widgets": meta_widgets})
     summary_text = (
         format_summary_block(desc.summary, desc.problem) if desc else format_summary_block(data.summary, data.problem)
     )
-    sections.append({
-        "header": "Görev Açıklaması",
-        "widgets": [{"textParagraph": {"text": summary_text}}],
-    })
 
     if desc and desc.solution_steps:
         solution_text = format_rich_solution_steps_html(desc.solution_steps)
+    elif data.analysis_steps:
+        solution_text = format_solution_steps_html(data.analysis_steps)
+    else:
+        solution_text = _default_steps_html(data.domain)
+
+    if data.acceptance_criteria:
+        criteria_text = format_acceptance_criteria_html(data.acceptance_criteria)
     else:
-        solution_text = format_solution_steps_html(data.resolved_steps())
-
-    sections.append({
-        "header": "Muhtemel Çözüm",
-        "widgets": [{"textParagraph": {"text": solution_text}}],
-    })
-
-    if desc and desc.advantages:
-        sections.append({
-            "header": "Çözümün Avantajları",
-            "widgets": [{"textParagraph": {"text": format_advantages_html(desc.advantages)}}],
-        })
-
-    sections.append({
-        "header": "Kabul Kriterleri",
-        "widgets": [{"textParagraph": {"text": format_acceptance_criteria_html(data.resolved_criteria())}}],
-    })
-
-    card = {"header": {"title": _h(data.title)}, "sections": sections}
-    return {"cards": [card]}
+        criteria_text = _default_criteria_html(data.domain)
+
+    sections: list[Payload] = [
+        {"widgets": meta_widgets},
+        _text_section(_SECTION_TASK, summary_text),
+        _text_section(_SECTION_SOLUTION, solution_text),
+        *(
+            [_text_section(_SECTION_ADVANTAGES, format_advantages_html(desc.advantages))]
+            if desc and desc.advantages
+            else []
+        ),
+        _text_section(_SECTION_CRITERIA, criteria_text),
+    ]
+
+    return {"cards": [{"header": {"title": _h(data.title)}, "sections": sections}]}
+
+
+def build_cards_payload_bytes(data: SendMessageInput, desc: TaskDescription | None = None) -> bytes:
+    """Return the cards payload from `build_cards_payload` serialized as UTF-8 JSON bytes."""
+    return orjson.dumps(build_cards_payload(data, desc))
@@ -1,23 +1,59 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import time
+
+_configured = False
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records in the same second."""
+
+    _cached: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        cached_second, cached_str = self._cached
+        if second == cached_second:
+            return cached_str
+        formatted = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+        self._cached = (second, formatted)
+        return formatted
 
 
 def setup_logging() -> logging.Logger:
-    """Configure and return the module logger."""
+    """Configure and return the module logger.
+
+    Safe to call repeatedly; the stderr handler is only attached once.
+    """
+    global _configured  # noqa: PLW0603
+    logger = logging.getLogger("task_messager")
+    if _configured:
+        return logger
+
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 
     handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(
-        logging.Formatter(
+        _SecondCachedFormatter(
             fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
     )
 
-    logger = logging.getLogger("task_messager")
+    # Records are queued in memory and written to stderr by a listener thread,
+    # so logging calls never block the event loop on a stderr write.
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     logger.setLevel(getattr(logging, log_level, logging.INFO))
-    logger.addHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(records))
     logger.propagate = False
+    _configured = True
 
     return logger
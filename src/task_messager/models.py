@@ -1,50 +1,49 @@
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass, field
-from typing import Any, TypedDict
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, ValidationInfo, field_validator
 
-from task_messager.core import DOMAINS
-
-
-class AnalysisStep(TypedDict):
-    """Define a single step in the investigation checklist, with a title and detailed explanation."""
-
-    title: str
-    detail: str
-
-
-class Domain(TypedDict):
-    """Define investigation template for a specific domain, including checklist steps and acceptance criteria."""
-
-    label: str
-    analysis_steps: list[AnalysisStep]
-    acceptance_criteria: list[str]
+from task_messager.domains import DOMAINS, Domain
 
 
 class SolutionStep(BaseModel):
     """Describe a single investigation step within the solution plan."""
 
+    model_config = ConfigDict(str_strip_whitespace=True, str_min_length=1, frozen=True)
+
     title: str = Field(..., description="Step heading, e.g., 'Sorgulama'")
     detail: str = Field(..., description="Step explanation")
 
-    @field_validator("title", "detail")
-    @classmethod
-    def non_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("Must not be empty")
-        return v.strip()
+
+@functools.cache
+def _domain_default_steps(domain: str) -> tuple[SolutionStep, ...]:
+    """Validate a domain's default analysis steps once and share them across requests."""
+    return tuple(SolutionStep(title=s.title, detail=s.detail) for s in DOMAINS[domain].analysis_steps)
+
+
+_DOMAIN_PATTERN = f"^({'|'.join(DOMAINS)})$"
+_PARTICIPANT_SPLIT = re.compile(r"\s*,\s*")
+# The required free-text fields are stripped and must not be blank; list items and
+# the domain are validated as given.
+_NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class SendMessageInput(BaseModel):
     """Structured data model representing a support investigation task."""
 
-    title: str = Field(..., description="Görevin kısa başlığı, tek cümle ile özet")
-    summary: str = Field(..., description="Görevin detaylı açıklaması, bağlam ve önemli noktalar")
-    problem: str = Field(..., description="Çözülmesi gereken spesifik problem veya soru")
-    estimated_duration: str = Field(..., description="Görevin tamamlanması için tahmini süre, örn. '2 saat', '12 saat'")
-    domain: str = Field(
+    model_config = ConfigDict(frozen=True)
+
+    title: _NonEmptyStr = Field(..., description="Görevin kısa başlığı, tek cümle ile özet")
+    summary: _NonEmptyStr = Field(..., description="Görevin detaylı açıklaması, bağlam ve önemli noktalar")
+    problem: _NonEmptyStr = Field(..., description="Çözülmesi gereken spesifik problem veya soru")
+    estimated_duration: _NonEmptyStr = Field(
+        ..., description="Görevin tamamlanması için tahmini süre, örn. '2 saat', '12 saat'"
+    )
+    domain: Annotated[str, StringConstraints(pattern=_DOMAIN_PATTERN)] = Field(
         default="general", description=f"Task domain — one of: {', '.join(DOMAINS.keys())}, Varsayılan 'general'"
     )
     task_owner: str | None = Field(None, description="Görevin atandığı tek kişi")
@@ -61,20 +60,6 @@ class SendMessageInput(BaseModel):
         description="Görev kabul kriterleri. Sağlanmazsa domain'e göre varsayılan kriterler kullanılır.",
     )
 
-    @field_validator("title", "summary", "problem", "estimated_duration")
-    @classmethod
-    def non_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("Must not be empty")
-        return v.strip()
-
-    @field_validator("domain")
-    @classmethod
-    def validate_domain(cls, v: str) -> str:
-        if v not in DOMAINS:
-            raise ValueError(f"Invalid domain '{v}'. Must be one of: {', '.join(DOMAINS.keys())}")
-        return v
-
     @field_validator("task_owner", mode="before")
     @classmethod
     def normalize_task_owner(cls, v: Any) -> str | None:
@@ -91,48 +76,43 @@ class SendMessageInput(BaseModel):
         if v is None:
             return None
         if isinstance(v, str):
-            parts = [p.strip().title() for p in v.split(",") if p.strip()]
+            parts = [p.title() for p in _PARTICIPANT_SPLIT.split(v.strip()) if p]
             return parts or None
         if isinstance(v, list):
             cleaned = [item.strip() for item in v if isinstance(item, str) and item.strip()]
             return cleaned or None
         raise ValueError("participants must be a string or list of strings")
 
-    @model_validator(mode="after")
-    def ensure_no_task_owner_in_participants(self) -> SendMessageInput:
-        if self.task_owner and self.participants:
-            self.participants = [p for p in self.participants if p != self.task_owner]
-            if not self.participants:
-                self.participants = None
-        return self
+    @field_validator("participants")
+    @classmethod
+    def ensure_no_task_owner_in_participants(cls, v: list[str] | None, info: ValidationInfo) -> list[str] | None:
+        task_owner = info.data.get("task_owner")
+        if task_owner and v:
+            return [p for p in v if p != task_owner] or None
+        return v
 
-    def resolved_domain(self) -> dict[str, Any]:
+    def resolved_domain(self) -> Domain:
         return DOMAINS.get(self.domain, DOMAINS["general"])
 
     def resolved_steps(self) -> list[SolutionStep]:
-        if self.analysis_steps:
-            return self.analysis_steps
-        return [SolutionStep.model_validate(s) for s in self.resolved_domain()["analysis_steps"]]
+        return self.analysis_steps or list(_domain_default_steps(self.domain))
 
     def resolved_criteria(self) -> list[str]:
-        if self.acceptance_criteria:
-            return self.acceptance_criteria
-        return list(self.resolved_domain()["acceptance_criteria"])
+        return self.acceptance_criteria or list(DOMAINS[self.domain].acceptance_criteria)
 
 
 class SendMessageResult(BaseModel):
     """Represent the response returned to the MCP client."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     message: str
     http_status: int | None = None
 
-    @field_validator("message")
-    @classmethod
-    def non_empty_message(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("Message must not be empty")
-        return v.strip()
+    def to_dict(self) -> dict[str, Any]:
+        """Same result as `model_dump()` without going through pydantic's serializer."""
+        return {"success": self.success, "message": self.message, "http_status": self.http_status}
 
 
 @dataclass
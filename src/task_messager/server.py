@@ -1,22 +1,63 @@
+import asyncio
+import functools
+import logging
 import os
 import sys
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import httpx
+from pydantic import TypeAdapter
 
-from task_messager.core import DOMAINS, app, httpx_client
-from task_messager.formatter import build_cards_payload
+from task_messager.core import app, close_httpx_client, get_httpx_client
+from task_messager.domains import DOMAINS
+from task_messager.formatter import build_cards_payload_bytes
 from task_messager.logger import setup_logging
 from task_messager.models import SendMessageInput, SendMessageResult, SolutionStep
 
-try:
-    import dotenv
+logger = logging.getLogger(__name__)
+
+_STEP_LIST_ADAPTER = TypeAdapter(list[SolutionStep])
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+# SendMessageResult is frozen, so the fixed misconfiguration result can be shared.
+_WEBHOOK_NOT_SET = SendMessageResult(success=False, message="GOOGLE_CHAT_WEBHOOK_URL is not set")
+
+# Transient webhook failures worth retrying. A ConnectError happens before the request
+# is sent and 503 means it was not processed, so a retry cannot post a card twice.
+# Timeouts are not retried, and 429 is left alone: Google Chat's quota is per minute.
+_RETRY_STATUSES = frozenset({503})
+_MAX_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.5
+# Retries start and finish within this many seconds of the first attempt.
+_RETRY_BUDGET = 5.0
+
+# DOMAINS is static, so the list_domains response is built once.
+_DOMAIN_SUMMARY: dict[str, Any] = {
+    domain_key: {
+        "label": info.label,
+        "default_steps": [s.title for s in info.analysis_steps],
+        "default_criteria_count": len(info.acceptance_criteria),
+    }
+    for domain_key, info in DOMAINS.items()
+}
+
+
+@functools.cache
+def _team_members() -> tuple[str, ...]:
+    """Parse TEAM_MEMBERS once; the environment does not change while the server runs."""
+    return tuple(m.strip() for m in os.getenv("TEAM_MEMBERS", "").split(",") if m.strip())
 
-    dotenv.load_dotenv()
-except ImportError:
-    pass
 
-logger = setup_logging()
+@functools.cache
+def _webhook_url() -> str:
+    """Read GOOGLE_CHAT_WEBHOOK_URL once, after `main()` has loaded `.env`."""
+    return os.getenv("GOOGLE_CHAT_WEBHOOK_URL", "").strip()
+
+
+@functools.cache
+def _default_task_owner() -> str | None:
+    """Read TASK_OWNER once, after `main()` has loaded `.env`."""
+    return os.getenv("TASK_OWNER")
 
 
 async def _resolve_task_owner_and_participants(
@@ -27,9 +68,6 @@ async def _resolve_task_owner_and_participants(
     Tries exact match first, then prefix/substring match. Falls back to original
     provided names if no known member is matched.
     """
-    effective_task_owner = None
-    effective_participants: list[str] | None = None
-
     try:
         members_resp = await list_members()
         known_members = members_resp.get("members", []) if isinstance(members_resp, dict) else []
@@ -50,48 +88,81 @@ async def _resolve_task_owner_and_participants(
                 return m
         return name
 
+    owner: str | None
+    candidates: Sequence[str]
     if isinstance(raw_owner, str) and "," in raw_owner and not participants:
-        parts = [p.strip() for p in raw_owner.split(",") if p.strip()]
-        if parts:
-            resolved_parts = [_match_name(p) for p in parts]
-            effective_task_owner = resolved_parts[0]
-            if len(resolved_parts) > 1:
-                effective_participants = list(resolved_parts[1:])
+        names = [p.strip() for p in raw_owner.split(",") if p.strip()]
+        owner, candidates = (names[0], names[1:]) if names else (None, ())
     else:
-        effective_task_owner = _match_name(raw_owner) if raw_owner else None
-        effective_participants = [_match_name(p) for p in (participants or []) if isinstance(p, str) and p.strip()]
+        owner, candidates = raw_owner, participants or ()
 
-    if effective_participants is None:
-        effective_participants = []
-
-    effective_participants = [p.strip() for p in effective_participants if isinstance(p, str) and p.strip()]
-    if effective_task_owner and isinstance(effective_task_owner, str):
-        effective_participants = [p for p in effective_participants if p != effective_task_owner]
+    effective_task_owner = _match_name(owner) if owner else None
+    effective_participants = [
+        name
+        for p in candidates
+        if isinstance(p, str) and p.strip() and (name := _match_name(p)) and name != effective_task_owner
+    ]
 
     return effective_task_owner, effective_participants
 
 
-async def post_to_webhook(payload: dict[str, Any]) -> SendMessageResult:
-    url = os.getenv("GOOGLE_CHAT_WEBHOOK_URL", "").strip()
+async def _post_with_retry(url: str, payload: bytes) -> httpx.Response:
+    """POST `payload`, retrying connection failures and 503s with backoff inside `_RETRY_BUDGET`.
+
+    The first attempt runs under the client's own timeouts; retries only get what is left
+    of the budget. When retrying stops, the last failure is returned or raised as is.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _RETRY_BUDGET
+    failure: httpx.Response | httpx.ConnectError
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        try:
+            async with asyncio.timeout_at(deadline if attempt > 1 else None):
+                resp = await get_httpx_client().post(url, content=payload, headers=_JSON_HEADERS)
+        except httpx.ConnectError as exc:
+            failure = exc
+        except TimeoutError:
+            logger.warning("Webhook retry ran out of its %.1fs budget", _RETRY_BUDGET)
+            break
+        else:
+            if resp.status_code not in _RETRY_STATUSES:
+                return resp
+            failure = resp
+
+        delay = _RETRY_BASE_DELAY * 2 ** (attempt - 1)
+        if attempt == _MAX_ATTEMPTS or loop.time() + delay >= deadline:
+            break
+        reason = f"HTTP {failure.status_code}" if isinstance(failure, httpx.Response) else repr(failure)
+        logger.warning("Webhook attempt %d failed (%s); retrying in %.1fs", attempt, reason, delay)
+        await asyncio.sleep(delay)
+
+    if isinstance(failure, httpx.Response):
+        return failure
+    raise failure
+
+
+async def post_to_webhook(payload: bytes) -> SendMessageResult:
+    url = _webhook_url()
     if not url:
         logger.warning("GOOGLE_CHAT_WEBHOOK_URL environment variable not set")
-        return SendMessageResult(success=False, message="GOOGLE_CHAT_WEBHOOK_URL is not set")
+        return _WEBHOOK_NOT_SET
 
     try:
         logger.info("Sending message to Google Chat webhook")
-        resp = await httpx_client.post(url, json=payload)
+        resp = await _post_with_retry(url, payload)
         resp.raise_for_status()
-        logger.info(f"Message sent successfully: HTTP {resp.status_code}")
+        logger.info("Message sent successfully: HTTP %s", resp.status_code)
         return SendMessageResult(success=True, message="Message sent", http_status=resp.status_code)
     except httpx.HTTPStatusError:
-        logger.error(f"Failed to send message: HTTP {resp.status_code} - {resp.text}")
+        body = resp.text
+        logger.error("Failed to send message: HTTP %s - %s", resp.status_code, body)
         return SendMessageResult(
             success=False,
-            message=f"HTTP {resp.status_code}: {resp.text}",
+            message=f"HTTP {resp.status_code}: {body}",
             http_status=resp.status_code,
         )
     except httpx.RequestError as exc:
-        logger.exception(f"Request error while sending message: {exc}")
+        logger.exception("Request error while sending message: %s", exc)
         return SendMessageResult(success=False, message=f"Request error: {exc}")
 
 
@@ -138,16 +209,13 @@ async def send_google_chat_message(
         acceptance_criteria: Custom acceptance criteria (optional, uses domain defaults if omitted)
     """
     try:
-        raw_owner = task_owner or os.getenv("TASK_OWNER")
+        raw_owner = task_owner or _default_task_owner()
         effective_task_owner, effective_participants = await _resolve_task_owner_and_participants(
             raw_owner, participants
         )
-        resolved_steps: list[SolutionStep] | None = None
-
-        if analysis_steps is not None:
-            resolved_steps = [SolutionStep.model_validate(step) for step in analysis_steps]
-        elif domain in DOMAINS:
-            resolved_steps = [SolutionStep.model_validate(step) for step in DOMAINS[domain]["analysis_steps"]]
+        # Without custom steps, SendMessageInput.resolved_steps() serves the domain
+        # defaults, which are validated once per domain and cached.
+        resolved_steps = _STEP_LIST_ADAPTER.validate_python(analysis_steps) if analysis_steps is not None else None
 
         data = SendMessageInput(
             title=title,
@@ -161,12 +229,12 @@ async def send_google_chat_message(
             acceptance_criteria=acceptance_criteria,
         )
     except Exception as e:
-        logger.error(f"Failed to parse input: {e}")
-        return SendMessageResult(success=False, message=f"Invalid input: {e}").model_dump()
+        logger.error("Failed to parse input: %s", e)
+        return SendMessageResult(success=False, message=f"Invalid input: {e}").to_dict()
 
-    payload = build_cards_payload(data)
+    payload = build_cards_payload_bytes(data)
     result = await post_to_webhook(payload)
-    return result.model_dump()
+    return result.to_dict()
 
 
 @app.tool(
@@ -177,14 +245,7 @@ async def send_google_chat_message(
 )
 async def list_domains() -> dict[str, Any]:
     """Return all available domains and their metadata."""
-    return {
-        domain_key: {
-            "label": info["label"],
-            "default_steps": [s["title"] for s in info["analysis_steps"]],
-            "default_criteria_count": len(info["acceptance_criteria"]),
-        }
-        for domain_key, info in DOMAINS.items()
-    }
+    return _DOMAIN_SUMMARY
 
 
 @app.tool(
@@ -196,17 +257,48 @@ async def list_domains() -> dict[str, Any]:
 )
 async def list_members() -> dict[str, Any]:
     """Return a list of members for name resolution."""
+    return {"members": list(_team_members())}
 
-    team_members = os.getenv("TEAM_MEMBERS", "")
-    members = [m.strip() for m in team_members.split(",") if m.strip()]
-    return {"members": members}
+
+async def _serve(transport: str) -> None:
+    """Run the MCP server on `transport` and release the webhook client on shutdown."""
+    runners = {
+        "stdio": app.run_stdio_async,
+        "sse": app.run_sse_async,
+        "streamable-http": app.run_streamable_http_async,
+    }
+    if transport not in runners:
+        raise ValueError(f"Unknown transport: {transport}")
+
+    try:
+        await runners[transport]()
+    finally:
+        await close_httpx_client()
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Prefer uvloop's event loop when the optional `uvloop` extra is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 def main() -> None:
+    try:
+        import dotenv
+
+        dotenv.load_dotenv()
+    except ImportError:
+        pass
+
+    setup_logging()
     logger.info("Starting MCP server...")
     try:
         MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "sse").lower()
-        app.run(transport=MCP_TRANSPORT)
+        with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+            runner.run(_serve(MCP_TRANSPORT))
     except KeyboardInterrupt:
         logger.info("Interrupted")
         sys.exit(0)
@@ -0,0 +1,128 @@
+import socket
+import ssl
+import time
+from collections.abc import Iterable
+
+import anyio
+import httpcore
+import httpx
+
+type SocketOption = tuple[int, int, int] | tuple[int, int, bytes | bytearray] | tuple[int, int, None, int]
+
+# Stagger between connect attempts, matching anyio's default.
+_HAPPY_EYEBALLS_DELAY = 0.25
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that remembers resolved host addresses for `ttl` seconds.
+
+    Connects race every cached address the way anyio's `connect_tcp` does (happy
+    eyeballs), so one unreachable address does not fail the request. A failed
+    connect drops the cached entry. TLS still verifies against the original host
+    name, since httpcore passes it to `start_tls` separately.
+    """
+
+    def __init__(self, ttl: float = 300.0) -> None:
+        self._backend = httpcore.AnyIOBackend()
+        self._ttl = ttl
+        self._cache: dict[tuple[str, int], tuple[float, tuple[str, ...]]] = {}
+
+    async def _resolve(self, host: str, port: int) -> tuple[str, ...]:
+        now = time.monotonic()
+        cached = self._cache.get((host, port))
+        if cached and cached[0] > now:
+            return cached[1]
+
+        try:
+            infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+
+        # Same ordering as anyio: first IPv6 address, then first IPv4 address, then the rest.
+        v6 = [str(info[4][0]) for info in infos if info[0] == socket.AF_INET6]
+        v4 = [str(info[4][0]) for info in infos if info[0] == socket.AF_INET]
+        ordered = [*v6[:1], *v4[:1], *v6[1:], *v4[1:]]
+        addresses = tuple(dict.fromkeys(ordered))
+        self._cache[(host, port)] = (now + self._ttl, addresses)
+        return addresses
+
+    async def _connect_first(
+        self,
+        addresses: tuple[str, ...],
+        port: int,
+        local_address: str | None,
+        socket_options: Iterable[SocketOption] | None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Start a connect per address, `_HAPPY_EYEBALLS_DELAY` apart, and keep the first that succeeds."""
+        connected: list[httpcore.AsyncNetworkStream] = []
+        errors: list[httpcore.ConnectError] = []
+
+        async def attempt(address: str, done: anyio.Event) -> None:
+            try:
+                stream = await self._backend.connect_tcp(
+                    address, port, local_address=local_address, socket_options=socket_options
+                )
+            except httpcore.ConnectError as exc:
+                errors.append(exc)
+            else:
+                if connected:
+                    await stream.aclose()
+                else:
+                    connected.append(stream)
+                    tg.cancel_scope.cancel()
+            finally:
+                done.set()
+
+        async with anyio.create_task_group() as tg:
+            for address in addresses:
+                done = anyio.Event()
+                tg.start_soon(attempt, address, done)
+                with anyio.move_on_after(_HAPPY_EYEBALLS_DELAY):
+                    await done.wait()
+
+        if not connected:
+            raise httpcore.ConnectError("; ".join(map(str, errors)) or "No addresses to connect to")
+        return connected[0]
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[SocketOption] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        # Resolution and the connect attempts share one `timeout` budget, as in the stock backend.
+        try:
+            with anyio.fail_after(timeout):
+                addresses = await self._resolve(host, port)
+                return await self._connect_first(addresses, port, local_address, socket_options)
+        except TimeoutError as exc:
+            self._cache.pop((host, port), None)
+            raise httpcore.ConnectTimeout(f"Timed out connecting to {host}") from exc
+        except httpcore.ConnectError:
+            self._cache.pop((host, port), None)
+            raise
+
+
+class CachingDNSTransport(httpx.AsyncHTTPTransport):
+    """`httpx.AsyncHTTPTransport` whose connection pool resolves hosts through `CachingDNSBackend`."""
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits,
+        verify: ssl.SSLContext | bool = True,
+        http2: bool = False,
+        dns_ttl: float = 300.0,
+    ) -> None:
+        # The parent initializer only builds `_pool`; build it here with our backend instead.
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=CachingDNSBackend(ttl=dns_ttl),
+        )